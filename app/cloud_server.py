@@ -7,9 +7,18 @@ from pydantic import BaseModel
 import os
 import requests
 from typing import List, Dict, Any
+from collections import Counter
 import pandas as pd
+import asyncio
+import time
 import re
 
+# Sibling import works for `python app/cloud_server.py`; the package path for `uvicorn app.cloud_server:app`
+try:
+    from sample_questions import SAMPLE_QUESTIONS
+except ImportError:
+    from app.sample_questions import SAMPLE_QUESTIONS
+
 app = FastAPI(title="Construction Consulting API", version="1.0.0")
 
 # Enable CORS for Streamlit Cloud
@@ -35,6 +44,25 @@ class ChatResponse(BaseModel):
 # Load cases data at startup
 cases_df = None
 
+# Precompute configuration - answers for frequent queries are generated while the API is idle
+PRECOMPUTE_TOP_N = int(os.getenv("PRECOMPUTE_TOP_N", 50))
+PRECOMPUTE_RATE_LIMIT = float(os.getenv("PRECOMPUTE_RATE_LIMIT", 10))  # max Gemini calls per minute
+PRECOMPUTE_IDLE_SECONDS = float(os.getenv("PRECOMPUTE_IDLE_SECONDS", 30))
+PRECOMPUTE_REFRESH_SECONDS = float(os.getenv("PRECOMPUTE_REFRESH_SECONDS", 6 * 3600))
+PRECOMPUTE_BACKOFF_SECONDS = float(os.getenv("PRECOMPUTE_BACKOFF_SECONDS", 60))  # doubles per consecutive failure
+MAX_TRACKED_QUERIES = 5000
+MAX_TRACKED_QUERY_LENGTH = 300  # longer messages are one-offs, not recurring questions
+
+# Query log and precomputed answers, keyed by normalized query
+query_counts = Counter()
+query_originals: Dict[str, str] = {}
+precomputed_answers: Dict[str, Dict[str, Any]] = {}
+precompute_attempts: Dict[str, float] = {}
+precompute_failures: Dict[str, int] = {}
+precompute_stats = {"requests": 0, "hits": 0, "attempted": 0, "computed": 0}
+last_request_time = 0.0
+precompute_task = None
+
 def load_cases():
     """Load the cases CSV file"""
     global cases_df
@@ -172,37 +200,205 @@ def gemini_response(query: str, search_results: list) -> str:
         print(f"❌ {error_msg}")
         return error_msg
     
+def normalize_query(query: str) -> str:
+    """Normalize a query so trivially different phrasings share a log entry"""
+    return " ".join(re.findall(r'\w+', query.lower()))
+
+def log_query(query: str) -> str:
+    """Record a query in the frequency log and return its normalized form"""
+    key = normalize_query(query)
+    if not key or len(query) > MAX_TRACKED_QUERY_LENGTH:
+        return key  # Punctuation-only and overlong messages are not worth logging
+    query_counts[key] += 1
+    query_originals.setdefault(key, query)
+    
+    # Trim the long tail so the log does not grow without bound
+    if len(query_counts) > MAX_TRACKED_QUERIES:
+        keep = dict(query_counts.most_common(MAX_TRACKED_QUERIES // 2))
+        query_counts.clear()
+        query_counts.update(keep)
+        for stale in set(query_originals) - set(keep):
+            query_originals.pop(stale, None)
+            precompute_attempts.pop(stale, None)
+            precompute_failures.pop(stale, None)
+        prune_precomputed(precompute_wanted())
+    return key
+
+def precompute_wanted() -> Dict[str, str]:
+    """Map normalized keys to the sample and top-N queries that should have precomputed answers"""
+    wanted = {normalize_query(q): q for q in SAMPLE_QUESTIONS}
+    for key, _ in query_counts.most_common(PRECOMPUTE_TOP_N):
+        wanted.setdefault(key, query_originals.get(key, key))
+    wanted.pop("", None)
+    return wanted
+
+def prune_precomputed(wanted: Dict[str, str]):
+    """Drop cached answers for queries that are no longer sample or top-N"""
+    for key in set(precomputed_answers) - set(wanted):
+        precomputed_answers.pop(key, None)
+
+def precompute_backoff(failures: int) -> float:
+    """Seconds to wait after the given number of consecutive failures"""
+    return min(PRECOMPUTE_BACKOFF_SECONDS * 2 ** (failures - 1), PRECOMPUTE_REFRESH_SECONDS)
+
+def precompute_candidates() -> List[str]:
+    """Return queries that need a (re)computed answer, most urgent first"""
+    now = time.time()
+    wanted = precompute_wanted()
+    prune_precomputed(wanted)
+    
+    missing, stale = [], []
+    for key, query in wanted.items():
+        failures = precompute_failures.get(key, 0)
+        if failures and now < precompute_attempts.get(key, 0.0) + precompute_backoff(failures):
+            continue  # Still backing off after a failed attempt
+        
+        cached = precomputed_answers.get(key)
+        if cached is None:
+            # Rotate through uncached queries so a failing one cannot starve the rest
+            missing.append((precompute_attempts.get(key, 0.0), query))
+        elif now - cached["computed_at"] >= PRECOMPUTE_REFRESH_SECONDS:
+            # Failed refreshes leave computed_at untouched, so also order by the last attempt
+            stale.append((max(cached["computed_at"], precompute_attempts.get(key, 0.0)), query))
+    
+    missing.sort()
+    stale.sort()
+    return [query for _, query in missing] + [query for _, query in stale]
+
+def precompute_metrics() -> Dict[str, Any]:
+    """Precompute cache statistics for the health endpoint"""
+    requests_seen = precompute_stats["requests"]
+    return {
+        "precompute_hit_rate": round(precompute_stats["hits"] / requests_seen, 3) if requests_seen else 0.0,
+        "precompute_hits": precompute_stats["hits"],
+        "chat_requests": requests_seen,
+        "precomputed_answers": len(precomputed_answers),
+        "precompute_attempts": precompute_stats["attempted"],
+        "precompute_runs": precompute_stats["computed"],
+        "tracked_queries": len(query_counts)
+    }
+
+async def precompute_loop():
+    """Refresh answers for sample and top-N queries while the API is idle"""
+    min_interval = 60.0 / PRECOMPUTE_RATE_LIMIT
+    consecutive_failures = 0
+    paused_until = 0.0
+    while True:
+        await asyncio.sleep(min_interval)
+        if time.time() < paused_until:
+            continue
+        if time.time() - last_request_time < PRECOMPUTE_IDLE_SECONDS:
+            continue
+        
+        candidates = precompute_candidates()
+        if not candidates:
+            continue
+        
+        query = candidates[0]
+        key = normalize_query(query)
+        precompute_attempts[key] = time.time()
+        precompute_stats["attempted"] += 1
+        try:
+            response = await asyncio.to_thread(answer_query, query, 6)
+        except Exception as e:
+            print(f"❌ Precompute failed for '{query}': {e}")
+            response = None
+        
+        # Only Gemini answers are worth caching; fallbacks are cheap and retried next refresh
+        if response is not None and response.method == "gemini":
+            precompute_stats["computed"] += 1
+            precomputed_answers[key] = {
+                "response": response,
+                "computed_at": time.time()
+            }
+            precompute_failures.pop(key, None)
+            consecutive_failures = 0
+            print(f"✅ Precomputed answer for '{query}'")
+        else:
+            # Back off this query and pause the scheduler so an outage or quota error is not hammered
+            precompute_failures[key] = precompute_failures.get(key, 0) + 1
+            consecutive_failures += 1
+            pause = precompute_backoff(consecutive_failures)
+            paused_until = time.time() + pause
+            print(f"⚠️ Precompute paused for {pause:.0f}s after {consecutive_failures} consecutive failure(s)")
+
 @app.on_event("startup")
 async def startup_event():
     """Load data when the app starts"""
+    global precompute_task
     load_cases()
+    # A rate limit of 0 or less disables precomputation
+    if PRECOMPUTE_RATE_LIMIT > 0:
+        precompute_task = asyncio.create_task(precompute_loop())
+
+@app.on_event("shutdown")
+async def shutdown_event():
+    """Stop the background precompute scheduler"""
+    if precompute_task is not None:
+        precompute_task.cancel()
 
 @app.get("/")
 async def root():
     """Health check endpoint"""
-    return {"status": "Construction Consulting API is running", "cases_loaded": len(cases_df) if cases_df is not None else 0}
+    return {
+        "status": "Construction Consulting API is running",
+        "cases_loaded": len(cases_df) if cases_df is not None else 0,
+        **precompute_metrics()
+    }
 
 @app.post("/chat", response_model=ChatResponse)
 async def chat(request: ChatRequest):
     """Main chat endpoint"""
-    search_results = simple_search(request.message, request.top_k)
+    global last_request_time
+    last_request_time = time.time()
+    precompute_stats["requests"] += 1
+    key = log_query(request.message)
+    
+    # Serve a fresh precomputed answer when one exists (sources only ever cover the top 3 cases)
+    cached = precomputed_answers.get(key)
+    if (cached is not None and request.top_k >= 3 and
+        time.time() - cached["computed_at"] < PRECOMPUTE_REFRESH_SECONDS):
+        precompute_stats["hits"] += 1
+        response = cached["response"]
+        return ChatResponse(
+            answer=response.answer,
+            sources=response.sources,
+            best_score=response.best_score,
+            method="precomputed"
+        )
+    
+    response = answer_query(request.message, request.top_k)
+    
+    # Reuse live Gemini answers for sample and top-N queries instead of recomputing them later
+    if response.method == "gemini" and request.top_k >= 3 and key in precompute_wanted():
+        precomputed_answers[key] = {
+            "response": response,
+            "computed_at": time.time()
+        }
+        precompute_failures.pop(key, None)
+    
+    return response
+
+def answer_query(message: str, top_k: int) -> ChatResponse:
+    """Search cases and build an answer, preferring Gemini over the simple fallback"""
+    search_results = simple_search(message, top_k)
     
     if search_results:
         # Try Gemini first
-        gemini_answer = gemini_response(request.message, search_results)
+        gemini_answer = gemini_response(message, search_results)
         
         # Check if Gemini failed (error message starts with "Gemini API error:")
         if gemini_answer.startswith("Gemini API error:"):
             print(f"⚠️ Gemini failed: {gemini_answer}")
             # Fall back to simple response
-            answer = generate_response(request.message, search_results)
+            answer = generate_response(message, search_results)
             method = "simple_search_fallback"
         else:
             print(f"✅ Gemini response generated successfully")
             answer = gemini_answer
             method = "gemini"
     else:
-        answer = generate_response(request.message, search_results)
+        answer = generate_response(message, search_results)
         method = "simple_search"
     
     return ChatResponse(
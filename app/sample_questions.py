@@ -0,0 +1,12 @@
+"""
+Sample questions shown in the UI and precomputed by the API
+"""
+
+SAMPLE_QUESTIONS = [
+    "Concrete slab shows early cracking after curing. What should I do?",
+    "Found rebar cover nonconformance during inspection. How to fix?",
+    "Cable tray is overfilled and there's overheating risk. Solutions?",
+    "What causes honeycombing in concrete and how to repair it?",
+    "HVAC system has low airflow complaints. What to check?",
+    "Paint is blistering after finishing. Root causes and fixes?"
+]
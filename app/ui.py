@@ -7,6 +7,8 @@ import time
 import os
 import markdown
 
+from sample_questions import SAMPLE_QUESTIONS
+
 # Configure the page
 st.set_page_config(
     page_title="Construction Consulting Agent",
@@ -257,16 +259,7 @@ if (st.session_state.messages and
 if not st.session_state.messages:
     st.markdown("### 💡 Try asking about:")
     
-    sample_questions = [
-        "Concrete slab shows early cracking after curing. What should I do?",
-        "Found rebar cover nonconformance during inspection. How to fix?",
-        "Cable tray is overfilled and there's overheating risk. Solutions?",
-        "What causes honeycombing in concrete and how to repair it?",
-        "HVAC system has low airflow complaints. What to check?",
-        "Paint is blistering after finishing. Root causes and fixes?"
-    ]
-    
-    for i, question in enumerate(sample_questions):
+    for i, question in enumerate(SAMPLE_QUESTIONS):
         if st.button(question, key=f"sample_{i}"):
             process_user_message(question)
 